@@ -6,9 +6,9 @@ import pytest
 from typing import Dict
 from distance_map import DistanceMap
 from domain import Truck, Parcel, Fleet
-from scheduler import GreedyScheduler
+from scheduler import GreedyScheduler, RandomScheduler
 from container import PriorityQueue, _shorter
-from experiment import SchedulingExperiment
+from experiment import SchedulingExperiment, run_experiments
 
 # This variable is used in the special pytest test case defined by function
 # test_experiment below.  The variable defines a single scheduling experiment
@@ -46,6 +46,15 @@ def test_distance_map_basic() -> None:
     assert m.distance('Montreal', 'Toronto') == 4
 
 
+def test_distance_map_two_distances() -> None:
+    """Test DistanceMap when distances in both directions are provided."""
+    m = DistanceMap()
+    m.add_distance('Toronto', 'Montreal', 4, 5)
+    assert m.distance('Toronto', 'Montreal') == 4
+    assert m.distance('Montreal', 'Toronto') == 5
+    assert m.distance('Toronto', 'Toronto') == 0
+
+
 def test_num_trucks_doctest() -> None:
     """Test the doctest provided for Fleet.num_trucks"""
     f = Fleet()
@@ -118,6 +127,14 @@ def test_average_fullness_doctest() -> None:
     assert f.average_fullness() == 50.0
 
 
+def test_fullness_follows_vol_used() -> None:
+    """Test that Truck.fullness reflects changes made directly to vol_used."""
+    t = Truck(1423, 10, 'Toronto')
+    assert t.pack(Parcel(1, 5, 'Buffalo', 'Hamilton')) is True
+    t.vol_used = 8
+    assert t.fullness() == 80.0
+
+
 def test_total_distance_travelled_doctest() -> None:
     """Test the doctest provided for Fleet.total_distance_travelled"""
     f = Fleet()
@@ -136,6 +153,21 @@ def test_total_distance_travelled_doctest() -> None:
     assert f.total_distance_travelled(m) == 36
 
 
+def test_total_distance_travelled_empty_truck() -> None:
+    """Test Fleet.total_distance_travelled when the last truck is empty."""
+    f = Fleet()
+    t1 = Truck(1423, 10, 'Toronto')
+    p1 = Parcel(1, 5, 'Toronto', 'Hamilton')
+    assert t1.pack(p1) is True
+    t2 = Truck(1333, 10, 'Toronto')
+
+    m = DistanceMap()
+    m.add_distance('Toronto', 'Hamilton', 9)
+    f.add_truck(t1)
+    f.add_truck(t2)
+    assert f.total_distance_travelled(m) == 18
+
+
 def test_average_distance_travelled_doctest() -> None:
     """Test the doctest provided for Fleet.average_distance_travelled"""
     f = Fleet()
@@ -154,6 +186,21 @@ def test_average_distance_travelled_doctest() -> None:
     assert f.average_distance_travelled(m) == 18.0
 
 
+def test_average_distance_travelled_empty_truck() -> None:
+    """Test Fleet.average_distance_travelled when the last truck is empty."""
+    f = Fleet()
+    t1 = Truck(1423, 10, 'Toronto')
+    p1 = Parcel(1, 5, 'Toronto', 'Hamilton')
+    assert t1.pack(p1) is True
+    t2 = Truck(1333, 10, 'Toronto')
+
+    m = DistanceMap()
+    m.add_distance('Toronto', 'Hamilton', 9)
+    f.add_truck(t1)
+    f.add_truck(t2)
+    assert f.average_distance_travelled(m) == 18.0
+
+
 def test_priority_queue_is_empty_doctest() -> None:
     """Test the doctest provided for PriorityQueue.is_empty"""
     pq = PriorityQueue(str.__lt__)
@@ -218,6 +265,83 @@ def test_greedy_scheduler_example() -> None:
     assert truck_parcels[3] == [21, 13]
 
 
+def test_greedy_scheduler_least_space() -> None:
+    """Test GreedyScheduler choosing the truck with the least space that still
+    fits each parcel, with ties on space broken by truck order."""
+    p1 = Parcel(1, 4, 'York', 'Ajax')
+    p2 = Parcel(2, 3, 'York', 'Barrie')
+    p3 = Parcel(3, 5, 'York', 'Cobourg')
+    p4 = Parcel(4, 9, 'York', 'Dundas')
+
+    t1 = Truck(1, 10, 'York')
+    t2 = Truck(2, 10, 'York')
+    t3 = Truck(3, 10, 'York')
+
+    f = Fleet()
+    f.add_truck(t1)
+    f.add_truck(t2)
+    f.add_truck(t3)
+
+    config = {'parcel_priority': 'volume',
+              'parcel_order': 'non-decreasing',
+              'truck_order': 'non-decreasing'}
+
+    scheduler = GreedyScheduler(config)
+    unscheduled = scheduler.schedule([p1, p2, p3, p4], [t1, t2, t3])
+
+    assert unscheduled == []
+    # p2 goes to the first of three equally empty trucks, p1 joins it as the
+    # tightest fit, and p3 and p4 skip trucks with too little space left.
+    assert f.parcel_allocations() == {1: [2, 1], 2: [3], 3: [4]}
+    assert t1.route == ['York', 'Barrie', 'Ajax', 'York']
+
+
+def test_greedy_scheduler_destination_match() -> None:
+    """Test GreedyScheduler preferring a truck whose route ends at the
+    parcel's destination, as truck routes change."""
+    p1 = Parcel(1, 10, 'York', 'Ajax')
+    p2 = Parcel(2, 9, 'York', 'Barrie')
+    p3 = Parcel(3, 5, 'York', 'Ajax')
+    p4 = Parcel(4, 4, 'York', 'Barrie')
+
+    t1 = Truck(1, 40, 'York')
+    t2 = Truck(2, 30, 'York')
+
+    f = Fleet()
+    f.add_truck(t1)
+    f.add_truck(t2)
+
+    config = {'parcel_priority': 'volume',
+              'parcel_order': 'non-increasing',
+              'truck_order': 'non-increasing'}
+
+    scheduler = GreedyScheduler(config)
+    unscheduled = scheduler.schedule([p1, p2, p3, p4], [t1, t2])
+
+    assert unscheduled == []
+    # t1 ends at Ajax and then at Barrie, so p3 goes to the roomiest truck,
+    # t2, while p4 goes to t1 even though t2 has more space.
+    assert f.parcel_allocations() == {1: [1, 2, 4], 2: [3]}
+    assert t1.route == ['York', 'Ajax', 'Barrie', 'York']
+    assert t2.route == ['York', 'Ajax', 'York']
+
+
+def test_random_scheduler_packs_each_parcel_once() -> None:
+    """Test that RandomScheduler never packs a parcel onto two trucks."""
+    parcels = [Parcel(i, 5, 'York', 'Toronto') for i in range(10)]
+    trucks = [Truck(1, 20, 'York'), Truck(2, 20, 'York')]
+
+    f = Fleet()
+    f.add_truck(trucks[0])
+    f.add_truck(trucks[1])
+
+    unscheduled = RandomScheduler().schedule(parcels, trucks)
+
+    packed = [pid for pids in f.parcel_allocations().values() for pid in pids]
+    assert len(packed) == len(set(packed)) == 8
+    assert len(unscheduled) == 2
+
+
 ################################################################################
 # The test below uses pytest.mark.parametrize.
 #
@@ -276,5 +400,28 @@ class TestExperiment:
         assert actual == pytest.approx(expected, abs=1e-1)
 
 
+def test_run_experiments() -> None:
+    """Test that run_experiments returns the same statistics, in the same
+    order, as running each experiment in turn."""
+    configs = []
+    for priority in ['volume', 'destination']:
+        for parcel_order in ['non-decreasing', 'non-increasing']:
+            for truck_order in ['non-decreasing', 'non-increasing']:
+                config = test_arguments[0][1].copy()
+                config.update({'parcel_priority': priority,
+                               'parcel_order': parcel_order,
+                               'truck_order': truck_order})
+                configs.append(config)
+    expected = [SchedulingExperiment(config).run() for config in configs]
+    # Make sure a mix-up in the order of the results would be detected.
+    assert len({str(stats) for stats in expected}) > 1
+    assert run_experiments(configs) == expected
+
+
+def test_run_experiments_empty() -> None:
+    """Test run_experiments with no configurations."""
+    assert run_experiments([]) == []
+
+
 if __name__ == '__main__':
     pytest.main(['a1_starter_tests.py'])
@@ -5,45 +5,138 @@ from the map file. (All reading from files is done in module experiment.)
 Instead, it provides public methods that can be called to store and look up
 distances.
 """
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
 
 
 class DistanceMap:
     """Distance map of distances between cities.
 
     === Private Attributes ===
-    _distances: distances between city1 and city2
+    _distances: distances between each pair of cities, stored once per pair
+      under the key (a, b) with a <= b as the tuple (a to b, b to a)
+    _city_idx: index of each city in <_matrix>
+    _matrix: dense table where _matrix[i][j] is the distance from the city
+      with index i to the city with index j, or -1 if it is unknown.  It is
+      None until finalize is called, and is reset whenever a distance is
+      added.
 
     === Sample Usage ===
     >>> m = DistanceMap()
     >>> m.add_distance('Toronto', 'Ajax', 9)
     >>> m.distance('Toronto', 'Ajax')
     9
+    >>> m.add_distance('Toronto', 'Barrie', 50, 55)
+    >>> m.distance('Barrie', 'Toronto')
+    55
     """
-    _distances: Dict[tuple, int]
+    _distances: Dict[Tuple[str, str], Tuple[int, int]]
+    _city_idx: Dict[str, int]
+    _matrix: Optional[List[List[int]]]
 
     def __init__(self) -> None:
         self._distances = {}
+        self._city_idx = {}
+        self._matrix = None
 
     def distance(self, city1: str, city2: str) -> int:
         """Return the distance from city1 to city 2 or -1 if they are not
          contained in this map.
          """
-        if (city1, city2) in self._distances:
-            return self._distances[(city1, city2)]
-        if city1 == city2:
-            return 0
-        return -1
+        if city1 <= city2:
+            pair = self._distances.get((city1, city2))
+            return -1 if pair is None else pair[0]
+        pair = self._distances.get((city2, city1))
+        return -1 if pair is None else pair[1]
 
     def add_distance(self, city1: str, city2: str, distance1: int,
                      distance2: int = -1) -> None:
         """Add the distance distance1 for city1 to city2 and distance2 for
         city2 to city1 if provided.
         """
-        self._distances[(city1, city2)] = distance1
-        self._distances[(city2, city1)] = distance2
         if distance2 == -1:
-            self._distances[(city2, city1)] = distance1
+            distance2 = distance1
+        if city1 <= city2:
+            self._distances[(city1, city2)] = (distance1, distance2)
+        else:
+            self._distances[(city2, city1)] = (distance2, distance1)
+        # A city is always at distance 0 from itself.
+        self._distances.setdefault((city1, city1), (0, 0))
+        self._distances.setdefault((city2, city2), (0, 0))
+        self._matrix = None
+
+    def finalize(self) -> None:
+        """Build the dense distance table used by route_distance from the
+        distances added so far.
+        """
+        self._city_idx = {}
+        for city1, city2 in self._distances:
+            self._city_idx.setdefault(city1, len(self._city_idx))
+            self._city_idx.setdefault(city2, len(self._city_idx))
+        n = len(self._city_idx)
+        self._matrix = [[-1] * n for _ in range(n)]
+        for (city1, city2), (distance1, distance2) in self._distances.items():
+            i = self._city_idx[city1]
+            j = self._city_idx[city2]
+            self._matrix[i][j] = distance1
+            self._matrix[j][i] = distance2
+
+    def route_distance(self, route: List[str]) -> int:
+        """Return the total distance of travelling through the cities in
+        <route>, in order.
+
+        Precondition: this map contains the distance between every pair of
+                      consecutive cities in <route>.
+
+        >>> m = DistanceMap()
+        >>> m.add_distance('Toronto', 'Ajax', 9)
+        >>> m.add_distance('Ajax', 'Barrie', 20, 25)
+        >>> m.route_distance(['Toronto', 'Ajax', 'Barrie', 'Ajax', 'Toronto'])
+        63
+        """
+        return self.route_distances([route])[0]
+
+    def route_distances(self, routes: List[List[str]]) -> List[int]:
+        """Return the total distance of each route in <routes>, in the same
+        order as <routes>.
+
+        Precondition: this map contains the distance between every pair of
+                      consecutive cities in each route of <routes>.
+
+        >>> m = DistanceMap()
+        >>> m.add_distance('Toronto', 'Ajax', 9)
+        >>> m.route_distances([['Toronto', 'Ajax', 'Toronto'], ['Toronto']])
+        [18, 0]
+        """
+        if self._matrix is None:
+            self.finalize()
+        matrix = self._matrix
+        city_idx = self._city_idx
+        distances = []
+        for route in routes:
+            if len(route) < 2:
+                distances.append(0)
+            else:
+                distances.append(_route_length(route, city_idx, matrix))
+        return distances
+
+
+def _route_length(route: List[str], city_idx: Dict[str, int],
+                  matrix: List[List[int]]) -> int:
+    """Return the length of <route>, using the city indices <city_idx> and the
+    distance table <matrix>.
+
+    Each city is looked up once, and the row of the previous city is kept, so
+    every edge costs one dict lookup and one row index.
+
+    Precondition: <route> contains at least one city.
+    """
+    total = 0
+    row = matrix[city_idx[route[0]]]
+    for city in route[1:]:
+        j = city_idx[city]
+        total += row[j]
+        row = matrix[j]
+    return total
 
 
 if __name__ == '__main__':
@@ -1,7 +1,7 @@
 """ Domain classes
 """
 
-from typing import List, Dict
+from typing import List, Dict, Set
 from distance_map import DistanceMap
 
 
@@ -22,6 +22,7 @@ class Parcel:
     >>> p.volume
     3
     """
+    __slots__ = ('id', 'volume', 'source', 'dest')
     id: int
     volume: int
     source: str
@@ -48,6 +49,9 @@ class Truck:
     vol_used: current volume used by parcels
     parcels: list of parcels inside this truck
 
+    === Private Attributes ===
+    _route_cities: the cities in <route>
+
     === Sample Usage ===
     >>> t = Truck(1234, 300, 'Toronto')
     >>> t.route
@@ -55,11 +59,14 @@ class Truck:
     >>> t.vol_cap
     300
     """
+    __slots__ = ('id', 'vol_cap', 'route', 'vol_used', 'parcels',
+                 '_route_cities')
     id: int
     vol_cap: int
     route: list
     vol_used: int
     parcels: list
+    _route_cities: Set[str]
 
     def __init__(self, t_id: int, vol_cap: int, depot: str) -> None:
         """Create a truck with a unique id t_id, volume capacity vol_cap,
@@ -70,6 +77,7 @@ class Truck:
         self.route = [depot]
         self.vol_used = 0
         self.parcels = []
+        self._route_cities = {depot}
 
     def pack(self, p: Parcel) -> bool:
         """Pack parcel p onto this truck if there is enough space. Return True
@@ -78,15 +86,16 @@ class Truck:
         if p.volume <= (self.vol_cap - self.vol_used):
             self.parcels.append(p)
             self.vol_used += p.volume
-            if len(self.route) > 1:
-                self.route.pop()
-            if p.dest not in self.route:
-                self.route.append(p.dest)
-            self.route.append(self.route[0])
+            if len(self.route) == 1:
+                self.route.append(self.route[0])
+            if p.dest not in self._route_cities:
+                self._route_cities.add(p.dest)
+                # Insert before the final return to the depot.
+                self.route.insert(len(self.route) - 1, p.dest)
             return True
         return False
 
-    def fullness(self) -> None:
+    def fullness(self) -> float:
         """Return the percentage of used space in this truck.
 
         >>> t = Truck(1234, 100, 'Toronto')
@@ -97,8 +106,7 @@ class Truck:
         5.0
 
         """
-        percent = (self.vol_used / self.vol_cap) * 100
-        return round(percent, 1)
+        return round(self.vol_used / self.vol_cap * 100, 1)
 
 
 class Fleet:
@@ -303,17 +311,7 @@ class Fleet:
         >>> f.total_distance_travelled(m)
         36
         """
-        total_distance = 0
-        for truck in self.trucks:
-            if len(truck.route) < 3:
-                total_distance = 0
-            else:
-                i = 0
-                while i < len(truck.route) - 1:
-                    total_distance += dmap.distance(truck.route[i],
-                                                    truck.route[i + 1])
-                    i += 1
-        return total_distance
+        return sum(self._truck_distances(dmap))
 
     def average_distance_travelled(self, dmap: DistanceMap) -> float:
         """Return the average distance travelled by the trucks in this fleet,
@@ -344,22 +342,21 @@ class Fleet:
         >>> f.average_distance_travelled(m)
         18.0
         """
-        total_distance = self.total_distance_travelled(dmap)
+        total_distance = 0
         count = 0
-        for truck in self.trucks:
-            truck_distance = 0
-            if len(truck.route) < 3:
-                truck_distance = 0
-            else:
-                i = 0
-                while i < len(truck.route) - 1:
-                    truck_distance += dmap.distance(truck.route[i],
-                                                    truck.route[i + 1])
-                    i += 1
+        for truck_distance in self._truck_distances(dmap):
             if truck_distance > 0:
+                total_distance += truck_distance
                 count += 1
         return total_distance / count
 
+    def _truck_distances(self, dmap: DistanceMap) -> List[int]:
+        """Return the distance travelled by each truck in this fleet,
+        according to the distances in <dmap>, in the same order as
+        <self.trucks>.
+        """
+        return dmap.route_distances([truck.route for truck in self.trucks])
+
 
 if __name__ == '__main__':
     import python_ta
@@ -6,8 +6,12 @@ run the experiment, generate statistics as the result of the experiment, and
 
 This module is responsible for all the reading of data from the data files.
 """
-from typing import List, Dict, Union
+from typing import Iterator, List, Dict, Union
 import json
+import mmap
+import os
+import sys
+from multiprocessing import Pool
 from scheduler import RandomScheduler, GreedyScheduler, Scheduler
 from domain import Parcel, Truck, Fleet
 from distance_map import DistanceMap
@@ -132,21 +136,51 @@ class SchedulingExperiment:
     # ----- Helper functions -----
 
 
+def _read_records(data_file: str) -> Iterator[List[bytes]]:
+    """Yield the comma-separated fields of each non-blank line of
+    <data_file>, as undecoded bytes.
+
+    Precondition: <data_file> is the path to a file of comma-separated values.
+    """
+    with open(data_file, 'rb') as file:
+        # mmap cannot map an empty file.
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            for line in iter(data.readline, b''):
+                if line.strip():
+                    yield line.split(b',')
+
+
+def _city_name(field: bytes, cities: Dict[bytes, str]) -> str:
+    """Return the interned city name in <field>, with surrounding whitespace
+    removed.
+
+    <cities> maps fields that have already been decoded to their city names,
+    so that each distinct field is only decoded once.  It is updated with
+    <field>.
+    """
+    city = cities.get(field)
+    if city is None:
+        city = sys.intern(field.strip().decode())
+        cities[field] = city
+    return city
+
+
 def read_parcels(parcel_file: str) -> List[Parcel]:
     """Read parcel data from <parcel_file> and return.
 
     Precondition: <parcel_file> is the path to a file containing parcel data.
     """
     p_list = []
+    cities = {}
     # read and add the parcels to the list.
-    with open(parcel_file, 'r') as file:
-        for line in file:
-            tokens = line.strip().split(',')
-            pid = int(tokens[0].strip())
-            source = tokens[1].strip()
-            destination = tokens[2].strip()
-            volume = int(tokens[3].strip())
-            p_list.append(Parcel(pid, volume, source, destination))
+    for tokens in _read_records(parcel_file):
+        pid = int(tokens[0])
+        source = _city_name(tokens[1], cities)
+        destination = _city_name(tokens[2], cities)
+        volume = int(tokens[3])
+        p_list.append(Parcel(pid, volume, source, destination))
     return p_list
 
 
@@ -158,17 +192,14 @@ def read_distance_map(distance_map_file: str) -> DistanceMap:
                   data.
     """
     d_map = DistanceMap()
-    with open(distance_map_file, 'r') as file:
-        for line in file:
-            tokens = line.strip().split(',')
-            c1 = tokens[0].strip()
-            c2 = tokens[1].strip()
-            distance1 = int(tokens[2].strip())
-            distance2 = int(tokens[3].strip()) if len(tokens) == 4 \
-                else distance1
-            d_map.add_distance(c1, c2, distance1)
-            if len(tokens) == 4:
-                d_map.add_distance(c1, c2, distance1, distance2)
+    cities = {}
+    for tokens in _read_records(distance_map_file):
+        c1 = _city_name(tokens[0], cities)
+        c2 = _city_name(tokens[1], cities)
+        distance1 = int(tokens[2])
+        distance2 = int(tokens[3]) if len(tokens) == 4 \
+            else distance1
+        d_map.add_distance(c1, c2, distance1, distance2)
     return d_map
 
 
@@ -179,15 +210,38 @@ def read_trucks(truck_file: str, depot_location: str) -> Fleet:
     Precondition: <truck_file> is a path to a file containing truck data.
     """
     f = Fleet()
-    with open(truck_file, 'r') as file:
-        for line in file:
-            tokens = line.strip().split(',')
-            tid = int(tokens[0])
-            capacity = int(tokens[1])
-            f.add_truck(Truck(tid, capacity, depot_location))
+    depot_location = sys.intern(depot_location)
+    for tokens in _read_records(truck_file):
+        tid = int(tokens[0])
+        capacity = int(tokens[1])
+        f.add_truck(Truck(tid, capacity, depot_location))
     return f
 
 
+def run_experiments(configs: List[Dict[str, Union[str, bool]]]) \
+        -> List[Dict[str, Union[int, float]]]:
+    """Run a separate experiment for each configuration in <configs> and
+    return the statistics of each, in the same order as <configs>.
+
+    The experiments are independent, so they are run in parallel, using no
+    more worker processes than there are configurations or CPUs.
+
+    Precondition: each configuration in <configs> contains keys and values.
+    """
+    if not configs:
+        return []
+    with Pool(min(len(configs), os.cpu_count() or 1)) as pool:
+        return pool.map(_run_one, configs)
+
+
+def _run_one(config: Dict[str, Union[str, bool]]) \
+        -> Dict[str, Union[int, float]]:
+    """Run a single experiment with the configuration <config> and return its
+    statistics.
+    """
+    return SchedulingExperiment(config).run()
+
+
 def simple_check(config_file: str) -> None:
     """Configure and run a single experiment on the scheduling problem
     defined in <config_file>.
@@ -206,10 +260,11 @@ def simple_check(config_file: str) -> None:
 if __name__ == '__main__':
     import python_ta
     python_ta.check_all(config={
-        'allowed-io': ['read_parcels', 'read_distance_map', 'read_trucks',
-                       '_print_report', 'simple_check'],
+        'allowed-io': ['_read_records', 'read_parcels', 'read_distance_map',
+                       'read_trucks', '_print_report', 'simple_check'],
         'allowed-import-modules': ['doctest', 'python_ta', 'typing',
-                                   'json', 'scheduler', 'domain',
+                                   'json', 'mmap', 'os', 'sys',
+                                   'multiprocessing', 'scheduler', 'domain',
                                    'distance_map'],
         'disable': ['E1136'],
         'max-attributes': 15,
@@ -11,7 +11,7 @@ reveals bugs in your code.
 """
 from typing import TextIO, Dict, Union
 import json
-from experiment import SchedulingExperiment
+from experiment import run_experiments
 
 
 def print_table_title(file: TextIO) -> None:
@@ -101,17 +101,20 @@ def compare_algorithms(config_file: str) -> None:
          'truck_order': 'non-increasing'}
     ]
 
+    configs = []
+    for item in algorithm_configurations:
+        # Start with the basic configuration <config>, and add the
+        # algorithm details from this item in our list of configurations.
+        config = basic_config.copy()
+        config.update(item)
+        configs.append(config)
+    # Run an experiment on each configuration, in parallel, and print the
+    # results to our csv file.
+    all_results = run_experiments(configs)
+
     with open('data/results.csv', 'w') as file:
         print_table_title(file)
-        for item in algorithm_configurations:
-            # Start with the basic configuration <config>, and add the
-            # algorithm details from this item in our list of configurations.
-            config = basic_config.copy()
-            config.update(item)
-            # Run an experiment on this configuration and print the results
-            # to our csv file.
-            expt = SchedulingExperiment(config)
-            results = expt.run(report=False)
+        for config, results in zip(configs, all_results):
             print_table_row(config, results, file)
 
 
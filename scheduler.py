@@ -3,9 +3,10 @@ This module contains the abstract Scheduler class, as well as the two
 subclasses RandomScheduler and GreedyScheduler, which implement the two
 scheduling algorithms described in the handout.
 """
-from typing import List
-from random import shuffle, choice
-from container import PriorityQueue
+from typing import Callable, List, Optional, Union
+from random import shuffle
+from bisect import bisect_left, insort
+from operator import attrgetter
 from domain import Parcel, Truck
 
 
@@ -41,40 +42,34 @@ class Scheduler:
 
 "===Helper Functions==="
 
-def _lighter(a: Parcel, b: Parcel) -> bool:
+def _first_fit(keys: List[int], volume: int, n: int,
+               most_space: bool) -> Optional[int]:
     """
-    Return True if parcel a is lighter than parcel b.
-    """
-    return a.volume < b.volume
-
+    Return the first key in <keys> whose truck has at least <volume>
+    available space, or None if there is no such truck.
 
-def _heavier(a: Parcel, b: Parcel) -> bool:
-    """
-    Return True if parcel a is heavier than parcel b.
-    """
-    return a.volume > b.volume
-
-
-def _smaller(a: Parcel, b: Parcel) -> bool:
-    """
-    Return True if parcel a destination is smaller than parcel b destination.
+    <keys> is sorted, and each key was made by GreedyScheduler._space_key
+    for one of <n> trucks.
     """
-    return a.dest < b.dest
+    if most_space:
+        if keys and -(keys[0] // n) >= volume:
+            return keys[0]
+        return None
+    i = bisect_left(keys, volume * n)
+    if i < len(keys):
+        return keys[i]
+    return None
 
 
-def _longer(a: Parcel, b: Parcel) -> bool:
+def _last_city(truck: Truck) -> str:
     """
-    Return True if parcel a destination is longer than parcel b destination.
+    Return the last city that <truck> visits before returning to its depot,
+    or the depot itself if its route is empty.
     """
-    return a.dest > b.dest
-
-
-def _most_space(a: Truck, b: Truck) -> bool:
-    return a.vol_cap - a.vol_used > b.vol_cap - b.vol_used
-
-
-def _least_space(a: Truck, b: Truck) -> bool:
-    return a.vol_cap - a.vol_used < b.vol_cap - b.vol_used
+    route = truck.route
+    if len(route) == 1:
+        return route[0]
+    return route[-2]
 
 
 class RandomScheduler(Scheduler):
@@ -95,19 +90,21 @@ class RandomScheduler(Scheduler):
         for p in parcels:
             self._parcels.append(p)
         shuffle(self._parcels)
-        scheduled = []
+        scheduled_ids = set()
         trucks2 = []
         for t in trucks:
             trucks2.append(t)
-        while len(trucks2) > 0:
-            t1 = choice(trucks2)
-            for p2 in self._parcels:
-                if t1.vol_cap - t1.vol_used >= p2.volume:
+        shuffle(trucks2)
+        parcels2 = self._parcels
+        for t1 in trucks2:
+            rem = t1.vol_cap - t1.vol_used
+            for p2 in parcels2:
+                volume = p2.volume
+                if volume <= rem and p2.id not in scheduled_ids:
                     t1.pack(p2)
-                    scheduled.append(p2)
-            trucks2.remove(t1)
-        for item in scheduled:
-            self._parcels.remove(item)
+                    scheduled_ids.add(p2.id)
+                    rem -= volume
+        self._parcels = [p for p in self._parcels if p.id not in scheduled_ids]
         return self._parcels
 
 
@@ -117,66 +114,80 @@ class GreedyScheduler(Scheduler):
     order parameters to achieve an efficient system.
 
     ===== Private Attributes =====
-    _parcels: List of all parcels objects in this scheduler.
-    _trucks: List of all trucks in this scheduler.
+    _parcel_key: Function that returns the value parcels are ordered by,
+      either their volume or their destination.
+    _non_increasing: True if parcels are considered from largest to smallest
+      key, False if from smallest to largest.
+    _most_space: True if trucks with the most available space are chosen
+      first, False if trucks with the least available space are.
     """
 
-    _parcels: list
-    _trucks: list
+    _parcel_key: Callable[[Parcel], Union[int, str]]
+    _non_increasing: bool
+    _most_space: bool
 
     def __init__(self, config: dict) -> None:
         if config['parcel_priority'] == 'volume':
-            if config['parcel_order'] == 'non-decreasing':
-                self._parcels = PriorityQueue(_lighter)
-            elif config['parcel_order'] == 'non-increasing':
-                self._parcels = PriorityQueue(_heavier)
-        elif config['parcel_priority'] == 'destination':
-            if config['parcel_order'] == 'non-decreasing':
-                self._parcels = PriorityQueue(_smaller)
-            elif config['parcel_order'] == 'non-increasing':
-                self._parcels = PriorityQueue(_longer)
-        if config['truck_order'] == 'non-decreasing':
-            self._trucks = PriorityQueue(_least_space)
-        elif config['truck_order'] == 'non-increasing':
-            self._trucks = PriorityQueue(_most_space)
+            self._parcel_key = attrgetter('volume')
+        else:
+            self._parcel_key = attrgetter('dest')
+        self._non_increasing = config['parcel_order'] == 'non-increasing'
+        self._most_space = config['truck_order'] == 'non-increasing'
+
+    def _space_key(self, truck: Truck, index: int, n: int) -> int:
+        """Return the key that orders <truck>, the truck at <index> out of <n>
+        trucks, among the trucks to choose from.  Trucks with smaller keys are
+        chosen first.
+
+        The key packs the truck's available space and its index into one int,
+        so ties on space are broken by index and the index is key % n.
+        """
+        space = truck.vol_cap - truck.vol_used
+        if self._most_space:
+            return -space * n + index
+        return space * n + index
 
     def schedule(self, parcels: List[Parcel], trucks: List[Truck],
                  verbose: bool = False) -> List[Parcel]:
-        for parcel in parcels:
-            self._parcels.add(parcel)
-        parcels2 = []
-        while not self._parcels.is_empty():
-            parcels2.append(self._parcels.remove())
-        scheduled = []
+        # Build a column of parcel keys and sort the parcel indices by it once.
+        # sorted is stable, even with reverse=True, so ties keep the order of
+        # <parcels>.
+        keys = [self._parcel_key(p) for p in parcels]
+        order = sorted(range(len(keys)), key=keys.__getitem__,
+                       reverse=self._non_increasing)
+        parcels2 = [parcels[i] for i in order]
+        # Keys of the trucks in the order they are considered, kept sorted as
+        # the trucks fill.
+        n = len(trucks)
+        trucks2 = sorted(self._space_key(t, i, n)
+                         for i, t in enumerate(trucks))
+        # The same keys, grouped by the last city on each truck's route.  Each
+        # group is sorted too, so it can be searched like <trucks2>.
+        by_last_city = {}
+        for key in trucks2:
+            t = trucks[key % n]
+            by_last_city.setdefault(_last_city(t), []).append(key)
+        scheduled_ids = set()
+        most_space = self._most_space
+        space_key = self._space_key
         for p in parcels2:
-            i = 0
-            packed = False
-            for truck in trucks:
-                self._trucks.add(truck)
-            trucks2 = []
-            while not self._trucks.is_empty():
-                trucks2.append(self._trucks.remove())
-            for t in trucks2:
-                if len(t.route) == 1 and t.vol_cap - t.vol_used >= p.volume and\
-                        t.route[len(t.route) - 1] == p.dest and packed is False:
-                    t.pack(p)
-                    scheduled.append(p)
-                    packed = True
-                elif len(t.route) > 1 and t.vol_cap - t.vol_used >= p.volume \
-                        and t.route[len(t.route) - 2] == p.dest and \
-                        packed is False:
-                    t.pack(p)
-                    scheduled.append(p)
-                    packed = True
-            while i < len(trucks2) and packed is False:
-                if trucks2[i].vol_cap - trucks2[i].vol_used >= p.volume:
-                    trucks2[i].pack(p)
-                    scheduled.append(p)
-                    packed = True
-                i += 1
-        for item in scheduled:
-            parcels2.remove(item)
-        return parcels2
+            volume = p.volume
+            chosen = _first_fit(by_last_city.get(p.dest, []), volume, n,
+                                most_space)
+            if chosen is None:
+                chosen = _first_fit(trucks2, volume, n, most_space)
+            if chosen is not None:
+                index = chosen % n
+                t = trucks[index]
+                del trucks2[bisect_left(trucks2, chosen)]
+                bucket = by_last_city[_last_city(t)]
+                del bucket[bisect_left(bucket, chosen)]
+                t.pack(p)
+                scheduled_ids.add(p.id)
+                key = space_key(t, index, n)
+                insort(trucks2, key)
+                insort(by_last_city.setdefault(_last_city(t), []), key)
+        return [p for p in parcels2 if p.id not in scheduled_ids]
 
 
 if __name__ == '__main__':
@@ -187,7 +198,7 @@ if __name__ == '__main__':
     python_ta.check_all(config={
         'allowed-io': ['compare_algorithms'],
         'allowed-import-modules': ['doctest', 'python_ta', 'typing',
-                                   'random', 'container', 'domain'],
+                                   'random', 'bisect', 'operator', 'domain'],
         'disable': ['E1136'],
         'max-attributes': 15,
     })